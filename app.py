@@ -3,8 +3,9 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import numpy as np
+import pyarrow.parquet as pq
 from datetime import datetime, timedelta
-import io
+import os
 from utils import *
 from email_service import send_critical_alert_email, send_critical_items_report, is_morning_alert_time
 
@@ -313,33 +314,164 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-@st.cache_data(ttl=60)  # Cache for 60 seconds only
+# Columns the dashboard actually reads from each dataset
+ORDER_COLUMNS = [
+    'order_id', 'supplier_id', 'category', 'abc_class', 'order_date', 'planned_delivery',
+    'delivery_date', 'quantity', 'total_value', 'lead_time', 'lead_time_target',
+    'mrp_compliance', 'setup_compliance', 'defect_rate', 'quality_cost', 'late_penalty',
+    'created_timestamp'
+]
+ORDER_DATE_COLUMNS = ['order_date', 'planned_delivery', 'delivery_date', 'created_timestamp']
+INVENTORY_COLUMNS = [
+    'product_id', 'current_stock', 'safety_stock', 'eoq', 'rop', 'inventory_value',
+    'carrying_cost', 'stock_status'
+]
+PRODUCT_COLUMNS = ['product_id', 'category', 'abc_class', 'unit_cost']
+SUPPLIER_COLUMNS = ['supplier_id', 'supplier_name', 'lead_time_target']
+
+# Low-cardinality text columns stored as pandas categoricals
+ORDER_CATEGORY_COLUMNS = ['category', 'abc_class', 'mrp_compliance', 'setup_compliance', 'supplier_id']
+CATEGORY_COLUMNS = {
+    'orders': ORDER_CATEGORY_COLUMNS,
+    'inventory': ['stock_status'],
+    'products': ['category', 'abc_class']
+}
+
+# Dataset name -> date columns to parse when building the Parquet copy
+DATA_FILES = {
+    'orders': ORDER_DATE_COLUMNS,
+    'inventory': [],
+    'products': [],
+    'suppliers': []
+}
+
+# Version of the prepared frames load_local_data persists to disk. Bump it whenever the
+# column lists, dtypes or derived flags change, so old cache entries aren't served
+DATA_PREP_VERSION = 1
+
+def convert_csv_to_parquet(data_dir='data'):
+    """Keep a typed Parquet copy of each CSV so loads skip CSV and date parsing"""
+    for name, date_columns in DATA_FILES.items():
+        csv_path = os.path.join(data_dir, f'{name}.csv')
+        parquet_path = os.path.join(data_dir, f'{name}.parquet')
+        
+        # The ETL rewrites the CSVs, so rebuild whenever the CSV is newer
+        if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path):
+            continue
+        
+        # Read labels straight into categoricals - Parquet keeps them dictionary-encoded
+        category_dtypes = {col: 'category' for col in CATEGORY_COLUMNS.get(name, [])}
+        df = pd.read_csv(csv_path, dtype=category_dtypes)
+        for col in date_columns:
+            if col in df.columns:
+                df[col] = pd.to_datetime(df[col], errors='coerce')
+        # Write the narrow integer types too, so loading the copy needs no conversion
+        df = downcast_integers(df)
+        df.to_parquet(parquet_path, engine='pyarrow', compression='zstd', index=False)
+
+def read_parquet_columns(path, columns=None):
+    """Read a Parquet file, skipping any requested columns the file doesn't have"""
+    if columns is not None:
+        available = set(pq.read_schema(path).names)
+        columns = [col for col in columns if col in available]
+    return pd.read_parquet(path, engine='pyarrow', columns=columns)
+
+def keep_columns(df, columns):
+    """Drop everything except the listed columns (the ones present in df)"""
+    return df.drop(columns=[col for col in df.columns if col not in columns])
+
+def convert_to_categories(df, name):
+    """Store repeated text labels as categoricals so filters and groupbys compare integer codes"""
+    for col in CATEGORY_COLUMNS.get(name, []):
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype('category')
+    return df
+
+def downcast_integers(df):
+    """Store whole-number columns as int32 - quantities, days and stock levels all fit"""
+    for col in df.select_dtypes(include='int64').columns:
+        df[col] = df[col].astype('int32')
+    return df
+
+def add_order_flags(orders):
+    """Precompute the per-order flags the KPIs reduce over, once per data load"""
+    orders['on_time'] = orders['delivery_date'] <= orders['planned_delivery']
+    orders['mrp_ok'] = orders['mrp_compliance'] == 'Compliant'
+    orders['setup_ok'] = orders['setup_compliance'] == 'Compliant'
+    orders['non_compliant'] = (
+        (orders['mrp_compliance'] == 'Non-Compliant') | (orders['setup_compliance'] == 'Non-Compliant')
+    )
+    # Integer day number, so daily grouping hashes ints instead of Python date objects
+    orders['order_day'] = (orders['order_date'] - pd.Timestamp('1970-01-01')).dt.days
+    return orders
+
+def add_inventory_flags(inventory):
+    """Precompute the reorder flag once per data load, next to the order flags"""
+    inventory['needs_reorder'] = np.less_equal(inventory['current_stock'].to_numpy(), inventory['rop'].to_numpy())
+    return inventory
+
+def add_product_details(inventory, products):
+    """Join the product attributes onto inventory once, instead of on every summary or render"""
+    return inventory.merge(products[['product_id', 'category', 'abc_class', 'unit_cost']],
+                           on='product_id', how='left')
+
+def data_file_versions(data_dir='data'):
+    """Modification times of the source CSVs, used to key the on-disk cache"""
+    return tuple(os.path.getmtime(os.path.join(data_dir, f'{name}.csv')) for name in DATA_FILES)
+
+def prepare_frames(orders, inventory, products, suppliers):
+    """Shared prep for both load paths: types, derived flags, product details and date order"""
+    orders, inventory, products = (
+        convert_to_categories(df, name) for df, name in
+        ((orders, 'orders'), (inventory, 'inventory'), (products, 'products'))
+    )
+    orders, inventory, products, suppliers = (
+        downcast_integers(df) for df in (orders, inventory, products, suppliers)
+    )
+    orders = add_order_flags(orders)
+    inventory = add_inventory_flags(add_product_details(inventory, products))
+    orders = orders.sort_values('order_date', kind='stable', ignore_index=True)
+    return orders, inventory, products, suppliers
+
+@st.cache_data(persist="disk", max_entries=2, show_spinner="Loading data...")
+def load_local_data(file_versions, prep_version):
+    """Read and prepare the local data files, kept on disk so a restarted app skips the parsing"""
+    # file_versions and prep_version are only here to key the cache
+    convert_csv_to_parquet()
+    orders = read_parquet_columns('data/orders.parquet', ORDER_COLUMNS)
+    inventory = read_parquet_columns('data/inventory.parquet', INVENTORY_COLUMNS)
+    products = read_parquet_columns('data/products.parquet', PRODUCT_COLUMNS)
+    suppliers = read_parquet_columns('data/suppliers.parquet', SUPPLIER_COLUMNS)
+    return prepare_frames(orders, inventory, products, suppliers)
+
+# cache_resource hands every caller the same frames instead of unpickling a fresh copy on
+# each hit - nothing downstream modifies them in place
+@st.cache_resource(ttl=60)  # Cache for 60 seconds only
 def load_data():
     try:
-        # Try loading from database first
+        # Try loading from database first - without its own CSV fallback, so a failed
+        # query comes back as None and we use the prepared local copies below instead
         from database import load_data_from_db
-        orders, inventory, products, suppliers = load_data_from_db()
+        orders, inventory, products, suppliers = load_data_from_db(csv_fallback=False)
         
         if orders is not None:
-            # Database load successful
+            # Database load successful - the queries select *, so trim to what we use
+            orders = keep_columns(orders, ORDER_COLUMNS)
+            inventory = keep_columns(inventory, INVENTORY_COLUMNS)
+            products = keep_columns(products, PRODUCT_COLUMNS)
+            suppliers = keep_columns(suppliers, SUPPLIER_COLUMNS)
+            orders, inventory, products, suppliers = prepare_frames(orders, inventory, products, suppliers)
             open_po = generate_open_purchase_orders(orders, suppliers)
             open_co = generate_open_customer_orders(products)
             return orders, inventory, products, suppliers, open_po, open_co
     except Exception as e:
         pass  # Fall through to CSV fallback
     
-    # Fallback to CSV files
+    # Fallback to the local data files (Parquet copies of the CSVs)
     try:
-        orders = pd.read_csv('data/orders.csv')
-        orders['order_date'] = pd.to_datetime(orders['order_date'], errors='coerce')
-        orders['planned_delivery'] = pd.to_datetime(orders['planned_delivery'], errors='coerce')
-        orders['delivery_date'] = pd.to_datetime(orders['delivery_date'], errors='coerce')
-        if 'created_timestamp' in orders.columns:
-            orders['created_timestamp'] = pd.to_datetime(orders['created_timestamp'], errors='coerce')
-        
-        inventory = pd.read_csv('data/inventory.csv')
-        products = pd.read_csv('data/products.csv')
-        suppliers = pd.read_csv('data/suppliers.csv')
+        # Keyed on the CSV mtimes and the prep version, so an ETL rewrite or a change to
+        # the prepared frames invalidates the disk cache
+        orders, inventory, products, suppliers = load_local_data(data_file_versions(), DATA_PREP_VERSION)
         
         open_po = generate_open_purchase_orders(orders, suppliers)
         open_co = generate_open_customer_orders(products)
@@ -404,7 +536,25 @@ def generate_open_customer_orders(products):
     df['total_value'] = df['quantity'] * df['unit_price']
     return df
 
-def create_dashboard_controls(orders, suppliers, products):
+@st.cache_data(ttl=60)
+def get_filter_options():
+    """Date bounds and multiselect options for the controls, worked out once per data load"""
+    orders, _, products, _, _, _ = load_data()
+    if 'created_timestamp' in orders.columns and not orders['created_timestamp'].isna().all():
+        latest_update = pd.to_datetime(orders['created_timestamp']).max()
+    else:
+        latest_update = None
+    return {
+        'min_date': orders['order_date'].min().date(),
+        'max_date': orders['order_date'].max().date(),
+        'latest_update': latest_update,
+        'order_count': len(orders),
+        'suppliers': tuple(orders['supplier_id'].cat.categories),
+        'abc_classes': tuple(sorted(products['abc_class'].unique())),
+        'categories': tuple(orders['category'].cat.categories)
+    }
+
+def create_dashboard_controls(filter_options):
     """Build the filter controls in the main layout"""
     st.markdown(f"#### {display_icon('controls', 20)} Dashboard Controls", unsafe_allow_html=True)
     
@@ -413,18 +563,17 @@ def create_dashboard_controls(orders, suppliers, products):
     with col1:
         if st.button("Refresh Data", help="Clear cache and reload latest data"):
             st.cache_data.clear()
+            load_data.clear()
             st.rerun()
     
     with col2:
         try:
-            if 'created_timestamp' in orders.columns and not orders['created_timestamp'].isna().all():
-                latest_order = pd.to_datetime(orders['created_timestamp']).max()
-                st.caption(f"Data updated: {latest_order.strftime('%H:%M:%S')}")
+            if filter_options['latest_update'] is not None:
+                st.caption(f"Data updated: {filter_options['latest_update'].strftime('%H:%M:%S')}")
             else:
-                latest_order = pd.to_datetime(orders['order_date']).max()
-                st.caption(f"Latest order: {latest_order.strftime('%Y-%m-%d')}")
+                st.caption(f"Latest order: {filter_options['max_date'].strftime('%Y-%m-%d')}")
         except Exception as e:
-            st.caption(f"Data loaded: {len(orders)} orders")
+            st.caption(f"Data loaded: {filter_options['order_count']} orders")
     
     st.markdown("#### Filters")
     
@@ -467,7 +616,9 @@ def create_dashboard_controls(orders, suppliers, products):
     )
     
     # Calculate the actual start date based on what they picked
-    end_date = orders['order_date'].max().date()
+    min_date = filter_options['min_date']
+    max_date = filter_options['max_date']
+    end_date = max_date
     if time_window == "Last 30 Days":
         start_date = end_date - timedelta(days=30)
     elif time_window == "Last 90 Days":
@@ -477,12 +628,9 @@ def create_dashboard_controls(orders, suppliers, products):
     elif time_window == "Last Year":
         start_date = end_date - timedelta(days=365)
     else:
-        start_date = orders['order_date'].min().date()
+        start_date = min_date
     
     # Ensure start_date is within valid range
-    min_date = orders['order_date'].min().date()
-    max_date = orders['order_date'].max().date()
-    
     if start_date < min_date:
         start_date = min_date
     if end_date > max_date:
@@ -498,7 +646,7 @@ def create_dashboard_controls(orders, suppliers, products):
     st.markdown("---")
     
     # Let users filter by specific suppliers
-    supplier_options = ['All Suppliers'] + sorted(orders['supplier_id'].unique().tolist())
+    supplier_options = ['All Suppliers'] + list(filter_options['suppliers'])
     selected_suppliers = st.multiselect(
         "Suppliers",
         options=supplier_options,
@@ -506,7 +654,7 @@ def create_dashboard_controls(orders, suppliers, products):
     )
     
     # Filter by product importance (A=most important, C=least)
-    abc_options = ['All Classes'] + sorted(products['abc_class'].unique().tolist())
+    abc_options = ['All Classes'] + list(filter_options['abc_classes'])
     selected_abc = st.multiselect(
         "ABC Classification",
         options=abc_options,
@@ -514,7 +662,7 @@ def create_dashboard_controls(orders, suppliers, products):
     )
     
     # Filter by type of product
-    category_options = ['All Categories'] + sorted(orders['category'].unique().tolist())
+    category_options = ['All Categories'] + list(filter_options['categories'])
     selected_categories = st.multiselect(
         "Product Categories",
         options=category_options,
@@ -538,59 +686,231 @@ def create_dashboard_controls(orders, suppliers, products):
 
 def filter_data(orders, products, filters):
     """Take the user's filter choices and apply them to the data"""
-    filtered_orders = orders.copy()
+    masks = []
     
-    # Only show orders from the selected date range
+    # Only show orders from the selected date range - orders are sorted by order_date
+    # at load, so the range is a binary search and a positional slice instead of a mask
     if len(filters['date_range']) == 2:
-        filtered_orders = filtered_orders[
-            (filtered_orders['order_date'].dt.date >= filters['date_range'][0]) &
-            (filtered_orders['order_date'].dt.date <= filters['date_range'][1])
-        ]
+        start = pd.Timestamp(filters['date_range'][0])
+        end = pd.Timestamp(filters['date_range'][1]) + pd.Timedelta(days=1)
+        lo, hi = orders['order_date'].searchsorted([start, end])
+        orders = orders.iloc[lo:hi]
     
     # Only show orders from selected suppliers
     if 'All Suppliers' not in filters['suppliers'] and filters['suppliers']:
-        filtered_orders = filtered_orders[filtered_orders['supplier_id'].isin(filters['suppliers'])]
+        masks.append(orders['supplier_id'].isin(filters['suppliers']))
     
     # Only show orders for selected product categories
     if 'All Categories' not in filters['categories'] and filters['categories']:
-        filtered_orders = filtered_orders[filtered_orders['category'].isin(filters['categories'])]
+        masks.append(orders['category'].isin(filters['categories']))
     
     # Only show orders for selected ABC classes
     if 'All Classes' not in filters['abc_classes'] and filters['abc_classes']:
-        filtered_orders = filtered_orders[filtered_orders['abc_class'].isin(filters['abc_classes'])]
+        masks.append(orders['abc_class'].isin(filters['abc_classes']))
     
     # Filter based on how well processes were followed
     if filters['compliance'] == "Compliant Only":
-        filtered_orders = filtered_orders[
-            (filtered_orders['mrp_compliance'] == 'Compliant') & 
-            (filtered_orders['setup_compliance'] == 'Compliant')
-        ]
+        masks.append(orders['mrp_ok'] & orders['setup_ok'])
     elif filters['compliance'] == "Non-Compliant Only":
-        filtered_orders = filtered_orders[
-            (filtered_orders['mrp_compliance'] == 'Non-Compliant') | 
-            (filtered_orders['setup_compliance'] == 'Non-Compliant')
-        ]
+        masks.append(orders['non_compliant'])
     elif filters['compliance'] == "Happy Path Only":
-        filtered_orders = filtered_orders[
-            (filtered_orders['mrp_compliance'] == 'Compliant') & 
-            (filtered_orders['setup_compliance'] == 'Compliant') &
-            (filtered_orders['delivery_date'] <= filtered_orders['planned_delivery']) &
-            (filtered_orders['defect_rate'] < 1.0)
-        ]
-    
-    return filtered_orders
+        masks.append(
+            orders['mrp_ok'] & orders['setup_ok'] & orders['on_time'] &
+            (orders['defect_rate'] < 1.0)
+        )
+    
+    # Combine every filter into one mask and slice the orders once
+    if not masks:
+        # st.cache_data hands callers their own copy, so no need to copy here too
+        return orders
+    return orders[np.logical_and.reduce([mask.to_numpy() for mask in masks])]
+
+@st.cache_data(ttl=60, max_entries=16)
+def get_filtered_orders(date_range, suppliers, categories, abc_classes, compliance):
+    """Filter the cached orders, reusing the result while the filter values stay the same"""
+    orders, _, products, _, _, _ = load_data()
+    filters = {
+        'date_range': date_range,
+        'suppliers': suppliers,
+        'abc_classes': abc_classes,
+        'categories': categories,
+        'compliance': compliance
+    }
+    return filter_data(orders, products, filters)
+
+def count_categories(labels):
+    """value_counts for a categorical column, from one bincount over its codes"""
+    codes = labels.cat.codes.to_numpy()
+    names = labels.cat.categories
+    # -1 codes are missing labels, which value_counts leaves out too
+    return pd.Series(
+        np.bincount(codes[codes >= 0], minlength=len(names)),
+        index=pd.CategoricalIndex(names, name=labels.name), name='count'
+    ).sort_values(ascending=False, kind='stable')
+
+@st.cache_data(ttl=60)
+def get_inventory_summary():
+    """Inventory summaries don't depend on the filters, so build them once per data load"""
+    _, inventory, _, _, _, _ = load_data()
+    
+    # Shortage below safety stock, worst items first
+    critical_display = inventory.loc[
+        inventory['stock_status'] == 'Critical', ['product_id', 'current_stock', 'safety_stock', 'rop']
+    ].assign(shortage=lambda d: d['safety_stock'] - d['current_stock']).sort_values('shortage', ascending=False)
+    
+    stock_counts = count_categories(inventory['stock_status'])
+    
+    # Reorder recommendations from the load-time flag, gathered by position
+    reorder_items = inventory.iloc[np.flatnonzero(inventory['needs_reorder'].to_numpy())]
+    reorder_display = reorder_items[['product_id', 'current_stock', 'rop']].assign(
+        recommended_qty=reorder_items['eoq'],
+        estimated_cost=reorder_items['eoq'] * reorder_items['unit_cost'],
+        priority=np.where(
+            reorder_items['current_stock'] < reorder_items['rop'] * 0.5, 'High', 'Medium'
+        )
+    )
+    
+    inventory_totals = inventory[['inventory_value', 'carrying_cost']].sum()
+    return {
+        'stock_counts': stock_counts,
+        'critical_display': critical_display,
+        'critical_count': int(stock_counts.get('Critical', 0)),
+        'working_capital': inventory_totals['inventory_value'],
+        'carrying_cost': inventory_totals['carrying_cost'],
+        'low_count': int(stock_counts.get('Low', 0)),
+        'abc_counts': count_categories(inventory['abc_class']),
+        'category_value': inventory.groupby('category', observed=True, sort=False)['inventory_value'].sum().reset_index(),
+        'reorder_display': reorder_display.sort_values('estimated_cost', ascending=False),
+        'reorder_csv': reorder_display.to_csv(index=False)
+    }
+
+def calculate_supplier_performance(filtered_orders):
+    """Aggregate every per-supplier metric the dashboard needs in one pass"""
+    supplier_perf = calculate_supplier_kpis(filtered_orders)
+    supplier_perf['otd_rate'] = supplier_perf['otd_rate'] * 100
+    return supplier_perf
+
+def calculate_supplier_scores(supplier_perf, supplier_table):
+    """Join supplier names onto the metrics and weight them into one performance score"""
+    supplier_details = supplier_perf.merge(supplier_table, on='supplier_id')
+    supplier_details['performance_score'] = (
+        (100 - supplier_details['avg_defect_rate']) * 0.3 +
+        supplier_details['otd_rate'] * 0.4 +
+        (100 - (supplier_details['avg_lead_time'] / supplier_details['avg_lead_time'].max() * 100)) * 0.3
+    )
+    return supplier_details
+
+@st.cache_data(ttl=60, max_entries=64)
+def get_order_summary(date_range, suppliers, categories, abc_classes, compliance):
+    """KPIs and supplier metrics for a filter selection, so repeat selections skip the reductions"""
+    filtered_orders = get_filtered_orders(date_range, suppliers, categories, abc_classes, compliance)
+    if len(filtered_orders) == 0:
+        # main() shows every order when nothing matches, so summarise those
+        filtered_orders = load_data()[0]
+    
+    supplier_perf = calculate_supplier_performance(filtered_orders)
+    supplier_details = calculate_supplier_scores(supplier_perf, load_data()[3])
+    scorecard_columns = ['supplier_id', 'supplier_name', 'performance_score', 'otd_rate', 'avg_defect_rate']
+    return {
+        'kpis': calculate_order_kpis(filtered_orders),
+        'supplier_perf': supplier_perf,
+        'top_suppliers': supplier_details.nlargest(5, 'performance_score')[scorecard_columns],
+        'bottom_suppliers': supplier_details.nsmallest(5, 'performance_score')[scorecard_columns],
+        'days_in_period': (filtered_orders['order_date'].max() - filtered_orders['order_date'].min()).days,
+        'unique_suppliers': filtered_orders['supplier_id'].nunique()
+    }
+
+@st.cache_data(ttl=60, max_entries=64)
+def get_compliance_summary(date_range, suppliers, categories, abc_classes, compliance):
+    """Compliance rates for a filter selection, so widget reruns skip the flag reductions"""
+    filtered_orders = get_filtered_orders(date_range, suppliers, categories, abc_classes, compliance)
+    if len(filtered_orders) == 0:
+        filtered_orders = load_data()[0]
+    
+    # Happy path = no problems at all
+    quality_ok = filtered_orders['defect_rate'] < 1.0
+    happy_path = filtered_orders['mrp_ok'] & filtered_orders['setup_ok'] & filtered_orders['on_time'] & quality_ok
+    return {
+        'happy_path_rate': happy_path.mean() * 100,
+        'mrp_compliance': filtered_orders['mrp_ok'].mean() * 100,
+        'setup_compliance': filtered_orders['setup_ok'].mean() * 100,
+        'quality_rate': quality_ok.mean() * 100,
+        'compliance_by_category': (
+            filtered_orders.groupby('category', observed=True)[['mrp_ok', 'setup_ok']].mean().mul(100)
+            .rename(columns={'mrp_ok': 'mrp_compliance', 'setup_ok': 'setup_compliance'})
+            .reset_index()
+        )
+    }
+
+@st.cache_data(ttl=60, max_entries=64)
+def get_forecast_summary(date_range, suppliers, categories, abc_classes, compliance):
+    """Daily demand vs forecast and its error stats for a filter selection, built from one aggregation"""
+    filtered_orders = get_filtered_orders(date_range, suppliers, categories, abc_classes, compliance)
+    if len(filtered_orders) == 0:
+        filtered_orders = load_data()[0]
+    forecast_data = generate_forecast_data(filtered_orders)
+    return {
+        'forecast_data': forecast_data,
+        'mape': calculate_mape(forecast_data['actual'], forecast_data['forecast']),
+        'bias': (forecast_data['forecast'] - forecast_data['actual']).mean()
+    }
+
+# Chart builders are keyed on the small frame they plot. cache_resource hands back the
+# same figure object on a hit instead of unpickling a copy - the tabs only ever read them.
+@st.cache_resource(max_entries=32)
+def build_spend_chart(supplier_spend):
+    """Bar chart of the top suppliers by procurement spend"""
+    fig_spend = px.bar(supplier_spend, x='supplier_id', y='total_value',
+                      title="Top 10 Suppliers by Procurement Spend",
+                      color='total_value', color_continuous_scale='Viridis',
+                      labels={'supplier_id': 'Supplier ID', 'total_value': 'Total Spend ($)'})
+    fig_spend.update_layout(
+        showlegend=False, 
+        height=400,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(size=12),
+        xaxis_title="Supplier ID",
+        yaxis_title="Total Procurement Spend ($)"
+    )
+    return fig_spend
 
-def overview_tab(filtered_orders, inventory, products, suppliers):
+@st.cache_resource(max_entries=32)
+def build_stock_status_chart(stock_counts):
+    """Donut chart of how many items sit at each stock status"""
+    colors = {'Critical': '#dc2626', 'Low': '#d97706', 'Normal': '#059669'}
+
+    # Plain go.Pie on the counts - px.pie would wrap them back into a DataFrame first
+    labels = [str(status) for status in stock_counts.index]
+    fig_stock = go.Figure(go.Pie(
+        labels=labels, values=stock_counts.tolist(), hole=0.4,
+        marker=dict(colors=[colors.get(status, '#6b7280') for status in labels]),
+        hovertemplate='%{label}: %{value}<extra></extra>'
+    ))
+    fig_stock.update_layout(
+        title="Inventory Stock Status Distribution",
+        height=400,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(size=12),
+        annotations=[dict(text='Stock<br>Levels', x=0.5, y=0.5, font_size=14, showarrow=False)]
+    )
+    return fig_stock
+
+def overview_tab(order_summary, inventory_summary):
     """Show the main dashboard with key metrics and charts"""
     st.markdown(f"### {display_icon('dashboard', 28)} Executive Summary", unsafe_allow_html=True)
     st.caption("Key performance indicators and financial metrics overview")
     
+    # Order KPIs are reduced once per filter selection in get_order_summary
+    kpis = order_summary['kpis']
+    
     # Show the most important financial numbers
     col1, col2, col3, col4, col5 = st.columns(5)
     
     with col1:
         try:
-            copq = filtered_orders['quality_cost'].sum() + filtered_orders['late_penalty'].sum()
+            copq = kpis['copq']
             st.markdown(f"""
             <div style="background: linear-gradient(135deg, #1e40af 0%, #3b82f6 100%); padding: 1.5rem; border-radius: 12px; color: white; margin: 0.5rem 0; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
                 <div style="font-size: 0.875rem; opacity: 0.9; margin-bottom: 0.5rem;">Cost of Poor Quality</div>
@@ -607,7 +927,7 @@ def overview_tab(filtered_orders, inventory, products, suppliers):
             """, unsafe_allow_html=True)
     
     with col2:
-        working_capital = inventory['inventory_value'].sum()
+        working_capital = inventory_summary['working_capital']
         st.markdown(f"""
         <div style="background: linear-gradient(135deg, #1e40af 0%, #3b82f6 100%); padding: 1.5rem; border-radius: 12px; color: white; margin: 0.5rem 0; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
             <div style="font-size: 0.875rem; opacity: 0.9; margin-bottom: 0.5rem;">Working Capital</div>
@@ -617,7 +937,7 @@ def overview_tab(filtered_orders, inventory, products, suppliers):
         """, unsafe_allow_html=True)
     
     with col3:
-        total_spend = filtered_orders['total_value'].sum()
+        total_spend = kpis['total_spend']
         st.markdown(f"""
         <div style="background: linear-gradient(135deg, #1e40af 0%, #3b82f6 100%); padding: 1.5rem; border-radius: 12px; color: white; margin: 0.5rem 0; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
             <div style="font-size: 0.875rem; opacity: 0.9; margin-bottom: 0.5rem;">Procurement Spend</div>
@@ -628,7 +948,7 @@ def overview_tab(filtered_orders, inventory, products, suppliers):
     
     with col4:
         try:
-            days_in_period = (filtered_orders['order_date'].max() - filtered_orders['order_date'].min()).days
+            days_in_period = order_summary['days_in_period']
             annualized_cogs = total_spend * (365 / max(days_in_period, 1))
             turnover = annualized_cogs / working_capital if working_capital > 0 else 0
             st.markdown(f"""
@@ -648,7 +968,7 @@ def overview_tab(filtered_orders, inventory, products, suppliers):
     
     with col5:
         try:
-            carrying_cost = inventory['carrying_cost'].sum()
+            carrying_cost = inventory_summary['carrying_cost']
             st.markdown(f"""
             <div style="background: linear-gradient(135deg, #1e40af 0%, #3b82f6 100%); padding: 1.5rem; border-radius: 12px; color: white; margin: 0.5rem 0; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
                 <div style="font-size: 0.875rem; opacity: 0.9; margin-bottom: 0.5rem;">Annual Carrying Cost</div>
@@ -670,7 +990,7 @@ def overview_tab(filtered_orders, inventory, products, suppliers):
     col1, col2, col3, col4, col5 = st.columns(5)
     
     with col1:
-        otd_pct = calculate_otd_percentage(filtered_orders)
+        otd_pct = kpis['otd_pct']
         delta = otd_pct - 85  # Target is 85%
         delta_color = "#22c55e" if delta >= 0 else "#fbbf24"  # Bright green or yellow for visibility
         delta_symbol = "↗" if delta >= 0 else "↘"
@@ -683,7 +1003,7 @@ def overview_tab(filtered_orders, inventory, products, suppliers):
         """, unsafe_allow_html=True)
     
     with col2:
-        avg_lead_time = filtered_orders['lead_time'].mean()
+        avg_lead_time = kpis['avg_lead_time']
         st.markdown(f"""
         <div style="background: linear-gradient(135deg, #1e40af 0%, #3b82f6 100%); padding: 1.5rem; border-radius: 12px; color: white; margin: 0.5rem 0; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
             <div style="font-size: 0.875rem; opacity: 0.9; margin-bottom: 0.5rem;">Avg Lead Time</div>
@@ -693,7 +1013,7 @@ def overview_tab(filtered_orders, inventory, products, suppliers):
         """, unsafe_allow_html=True)
     
     with col3:
-        compliance = calculate_process_compliance(filtered_orders, ['mrp_compliance', 'setup_compliance'])
+        compliance = kpis['compliance']
         st.markdown(f"""
         <div style="background: linear-gradient(135deg, #1e40af 0%, #3b82f6 100%); padding: 1.5rem; border-radius: 12px; color: white; margin: 0.5rem 0; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
             <div style="font-size: 0.875rem; opacity: 0.9; margin-bottom: 0.5rem;">Process Compliance</div>
@@ -703,7 +1023,7 @@ def overview_tab(filtered_orders, inventory, products, suppliers):
         """, unsafe_allow_html=True)
     
     with col4:
-        avg_defect_rate = filtered_orders['defect_rate'].mean()
+        avg_defect_rate = kpis['avg_defect_rate']
         st.markdown(f"""
         <div style="background: linear-gradient(135deg, #1e40af 0%, #3b82f6 100%); padding: 1.5rem; border-radius: 12px; color: white; margin: 0.5rem 0; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
             <div style="font-size: 0.875rem; opacity: 0.9; margin-bottom: 0.5rem;">Avg Defect Rate</div>
@@ -713,7 +1033,7 @@ def overview_tab(filtered_orders, inventory, products, suppliers):
         """, unsafe_allow_html=True)
     
     with col5:
-        critical_stock = (inventory['stock_status'] == 'Critical').sum()
+        critical_stock = inventory_summary['critical_count']
         st.markdown(f"""
         <div style="background: linear-gradient(135deg, #1e40af 0%, #3b82f6 100%); padding: 1.5rem; border-radius: 12px; color: white; margin: 0.5rem 0; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
             <div style="font-size: 0.875rem; opacity: 0.9; margin-bottom: 0.5rem;">Critical Stock Items</div>
@@ -728,59 +1048,109 @@ def overview_tab(filtered_orders, inventory, products, suppliers):
     
     with col1:
         # Show which suppliers we spend the most money with
-        supplier_spend = filtered_orders.groupby('supplier_id')['total_value'].sum().reset_index()
-        supplier_spend = supplier_spend.sort_values('total_value', ascending=False).head(10)
+        supplier_spend = order_summary['supplier_perf'].nlargest(10, 'total_spend')[['supplier_id', 'total_spend']]
+        supplier_spend = supplier_spend.rename(columns={'total_spend': 'total_value'})
         
-        fig_spend = px.bar(supplier_spend, x='supplier_id', y='total_value',
-                          title="Top 10 Suppliers by Procurement Spend",
-                          color='total_value', color_continuous_scale='Viridis',
-                          labels={'supplier_id': 'Supplier ID', 'total_value': 'Total Spend ($)'})
-        fig_spend.update_layout(
-            showlegend=False, 
-            height=400,
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(size=12),
-            xaxis_title="Supplier ID",
-            yaxis_title="Total Procurement Spend ($)"
-        )
+        fig_spend = build_spend_chart(supplier_spend)
         st.plotly_chart(fig_spend, use_container_width=True)
     
     with col2:
         # Show how many items are at different stock levels
-        stock_counts = inventory['stock_status'].value_counts()
-        colors = {'Critical': '#dc2626', 'Low': '#d97706', 'Normal': '#059669'}
-        
-        fig_stock = px.pie(values=stock_counts.values, names=stock_counts.index,
-                          title="Inventory Stock Status Distribution", hole=0.4,
-                          color=stock_counts.index, color_discrete_map=colors)
-        fig_stock.update_layout(
-            height=400,
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(size=12),
-            annotations=[dict(text='Stock<br>Levels', x=0.5, y=0.5, font_size=14, showarrow=False)]
-        )
+        fig_stock = build_stock_status_chart(inventory_summary['stock_counts'])
         st.plotly_chart(fig_stock, use_container_width=True)
 
-def inventory_tab(inventory, products, open_po):
+@st.cache_resource(max_entries=32)
+def build_abc_chart(abc_counts):
+    """Bar chart of product counts per ABC class"""
+    fig_abc = px.bar(x=abc_counts.index, y=abc_counts.values,
+                    title="Product Count by ABC Classification",
+                    color=abc_counts.index, color_discrete_sequence=['#dc2626', '#d97706', '#059669'],
+                    labels={'x': 'ABC Class', 'y': 'Number of Products'})
+    fig_abc.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(size=12),
+        xaxis_title="ABC Classification (A=High Value, B=Medium, C=Low)",
+        yaxis_title="Number of Products in Inventory"
+    )
+    return fig_abc
+
+@st.cache_resource(max_entries=32)
+def build_category_value_chart(category_value):
+    """Pie chart of inventory value per product category"""
+    # Plain go.Pie like the stock status donut, so plotly skips the DataFrame round trip
+    fig_cat = go.Figure(go.Pie(
+        labels=[str(category) for category in category_value['category']],
+        values=category_value['inventory_value'].to_numpy(),
+        hovertemplate='category=%{label}<br>inventory_value=%{value}<extra></extra>'
+    ))
+    fig_cat.update_layout(
+        title="Inventory Value Distribution by Product Category",
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(size=12),
+        annotations=[dict(text='Total<br>Value', x=0.5, y=0.5, font_size=14, showarrow=False)]
+    )
+    return fig_cat
+
+@st.cache_resource(max_entries=32)
+def build_po_status_chart(po_status):
+    """Bar chart of open purchase orders per status"""
+    po_colors = {'Pending': '#0ea5e9', 'In Transit': '#d97706', 'Delayed': '#dc2626'}
+    fig_po = px.bar(x=po_status.index, y=po_status.values,
+                   title="Open Purchase Orders by Status",
+                   color=po_status.index, color_discrete_map=po_colors,
+                   labels={'x': 'Order Status', 'y': 'Number of Orders'})
+    fig_po.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(size=12),
+        xaxis_title="Purchase Order Status",
+        yaxis_title="Number of Open Orders"
+    )
+    return fig_po
+
+@st.fragment
+def critical_items_section(critical_display):
+    """Critical items list and report button - clicking it only reruns this section"""
+    col1, col2 = st.columns([3, 1])
+    
+    with col1:
+        with st.expander("View Critical Items"):
+            st.dataframe(critical_display, use_container_width=True)
+    
+    with col2:
+        if st.button("Email Report", help="Send critical items report to supervisor"):
+            try:
+                if send_critical_items_report(critical_display):
+                    st.success("Report sent!")
+                    st.info("Check spam/junk folder too")
+                else:
+                    st.error("Failed to send - Gmail daily limit exceeded (150+ emails)")
+                    st.info("Wait 24 hours or use a different email service")
+            except Exception as e:
+                st.error(f"Email error: {str(e)}")
+                if "quota" in str(e).lower() or "limit" in str(e).lower():
+                    st.info("Gmail has blocked further emails due to daily limit")
+
+def inventory_tab(open_po, inventory_summary):
     """Show inventory levels and what needs to be reordered"""
     st.markdown(f"### {display_icon('inventory', 28)} Inventory Management", unsafe_allow_html=True)
     st.caption("Stock levels, reorder recommendations, and inventory optimization")
     
     # Warn about items that are running low
-    critical_items = inventory[inventory['stock_status'] == 'Critical']
-    low_items = inventory[inventory['stock_status'] == 'Low']
+    critical_display = inventory_summary['critical_display']
+    low_count = inventory_summary['low_count']
     
-    if len(critical_items) > 0:
-        st.error(f"CRITICAL ALERT: {len(critical_items)} items are at critical stock levels!")
+    if len(critical_display) > 0:
+        st.error(f"CRITICAL ALERT: {len(critical_display)} items are at critical stock levels!")
         
         # Auto-send alert email (only at 6:00 AM)
         if is_morning_alert_time():
             critical_key = f"morning_alert_{datetime.now().strftime('%Y%m%d')}"
             if critical_key not in st.session_state:
                 try:
-                    if send_critical_alert_email(len(critical_items)):
+                    if send_critical_alert_email(len(critical_display)):
                         st.success("✓ Morning critical alert email sent to supervisor")
                         st.info("Check spam/junk folder too")
                     else:
@@ -808,55 +1178,24 @@ def inventory_tab(inventory, products, open_po):
             elif email_count > 0:
                 st.info(f"📧 Emails sent today: {email_count}/10")
         
-        col1, col2 = st.columns([3, 1])
-        
-        with col1:
-            with st.expander("View Critical Items"):
-                critical_display = critical_items[['product_id', 'current_stock', 'safety_stock', 'rop']].copy()
-                critical_display['shortage'] = critical_display['safety_stock'] - critical_display['current_stock']
-                st.dataframe(critical_display, use_container_width=True)
-        
-        with col2:
-            if st.button("Email Report", help="Send critical items report to supervisor"):
-                critical_display = critical_items[['product_id', 'current_stock', 'safety_stock', 'rop']].copy()
-                critical_display['shortage'] = critical_display['safety_stock'] - critical_display['current_stock']
-                
-                try:
-                    if send_critical_items_report(critical_display):
-                        st.success("Report sent!")
-                        st.info("Check spam/junk folder too")
-                    else:
-                        st.error("Failed to send - Gmail daily limit exceeded (150+ emails)")
-                        st.info("Wait 24 hours or use a different email service")
-                except Exception as e:
-                    st.error(f"Email error: {str(e)}")
-                    if "quota" in str(e).lower() or "limit" in str(e).lower():
-                        st.info("Gmail has blocked further emails due to daily limit")
+        critical_items_section(critical_display)
     
-    if len(low_items) > 0:
-        st.warning(f"WARNING: {len(low_items)} items are at low stock levels")
+    if low_count > 0:
+        st.warning(f"WARNING: {low_count} items are at low stock levels")
     
     # Show what we should order more of
     st.markdown(f"#### {display_icon('reorder', 24)} Reorder Recommendations", unsafe_allow_html=True)
     st.caption("Items requiring immediate attention based on current stock levels and reorder points")
     
-    reorder_items = inventory[inventory['current_stock'] <= inventory['rop']].copy()
-    if len(reorder_items) > 0:
-        reorder_items['recommended_qty'] = reorder_items['eoq']
-        reorder_items['estimated_cost'] = reorder_items['recommended_qty'] * products.set_index('product_id')['unit_cost']
-        
-        reorder_display = reorder_items[['product_id', 'current_stock', 'rop', 'recommended_qty', 'estimated_cost']].copy()
-        reorder_display['priority'] = reorder_display.apply(
-            lambda x: 'High' if x['current_stock'] < x['rop'] * 0.5 else 'Medium', axis=1
-        )
-        
-        st.dataframe(reorder_display.sort_values('estimated_cost', ascending=False), use_container_width=True)
+    # Built once per data load in get_inventory_summary
+    reorder_display = inventory_summary['reorder_display']
+    if len(reorder_display) > 0:
+        st.dataframe(reorder_display, use_container_width=True)
         
         # Let users download the reorder list as a file
-        csv = reorder_display.to_csv(index=False)
         st.download_button(
             label="↓ Download Reorder List",
-            data=csv,
+            data=inventory_summary['reorder_csv'],
             file_name=f"reorder_recommendations_{datetime.now().strftime('%Y%m%d')}.csv",
             mime="text/csv"
         )
@@ -868,33 +1207,12 @@ def inventory_tab(inventory, products, open_po):
     
     with col1:
         # Show breakdown by product importance
-        abc_counts = inventory.merge(products[['product_id', 'abc_class']], on='product_id')['abc_class'].value_counts()
-        fig_abc = px.bar(x=abc_counts.index, y=abc_counts.values,
-                        title="Product Count by ABC Classification",
-                        color=abc_counts.index, color_discrete_sequence=['#dc2626', '#d97706', '#059669'],
-                        labels={'x': 'ABC Class', 'y': 'Number of Products'})
-        fig_abc.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(size=12),
-            xaxis_title="ABC Classification (A=High Value, B=Medium, C=Low)",
-            yaxis_title="Number of Products in Inventory"
-        )
+        fig_abc = build_abc_chart(inventory_summary['abc_counts'])
         st.plotly_chart(fig_abc, use_container_width=True)
     
     with col2:
         # Show how much money is tied up in each product type
-        inv_category = inventory.merge(products[['product_id', 'category']], on='product_id')
-        category_value = inv_category.groupby('category')['inventory_value'].sum().reset_index()
-        
-        fig_cat = px.pie(category_value, values='inventory_value', names='category',
-                        title="Inventory Value Distribution by Product Category")
-        fig_cat.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(size=12),
-            annotations=[dict(text='Total<br>Value', x=0.5, y=0.5, font_size=14, showarrow=False)]
-        )
+        fig_cat = build_category_value_chart(inventory_summary['category_value'])
         st.plotly_chart(fig_cat, use_container_width=True)
     
     # Show orders we've placed but haven't received yet
@@ -931,36 +1249,12 @@ def inventory_tab(inventory, products, open_po):
     
     # Show how many orders are in each status
     po_status = open_po['status'].value_counts()
-    po_colors = {'Pending': '#0ea5e9', 'In Transit': '#d97706', 'Delayed': '#dc2626'}
-    fig_po = px.bar(x=po_status.index, y=po_status.values,
-                   title="Open Purchase Orders by Status",
-                   color=po_status.index, color_discrete_map=po_colors,
-                   labels={'x': 'Order Status', 'y': 'Number of Orders'})
-    fig_po.update_layout(
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(size=12),
-        xaxis_title="Purchase Order Status",
-        yaxis_title="Number of Open Orders"
-    )
+    fig_po = build_po_status_chart(po_status)
     st.plotly_chart(fig_po, use_container_width=True)
 
-def suppliers_tab(filtered_orders, suppliers, open_po):
-    """Show how well our suppliers are performing"""
-    st.markdown(f"### {display_icon('suppliers', 28)} Supplier Performance", unsafe_allow_html=True)
-    st.caption("Supplier scorecards, performance matrix, and relationship management")
-    
-    # Calculate key performance metrics for each supplier
-    supplier_perf = filtered_orders.groupby('supplier_id').agg({
-        'defect_rate': 'mean',
-        'lead_time': 'mean',
-        'total_value': 'sum',
-        'delivery_date': lambda x: ((filtered_orders.loc[x.index, 'delivery_date'] <= 
-                                   filtered_orders.loc[x.index, 'planned_delivery']).mean() * 100)
-    }).reset_index()
-    supplier_perf.columns = ['supplier_id', 'avg_defect_rate', 'avg_lead_time', 'total_spend', 'otd_rate']
-    
-    # Create a chart showing supplier performance
+@st.cache_resource(max_entries=32)
+def build_supplier_matrix_chart(supplier_perf):
+    """Scatter of supplier lead time vs defect rate, sized by spend"""
     fig_matrix = px.scatter(supplier_perf, x='avg_lead_time', y='avg_defect_rate',
                            size='total_spend', color='otd_rate',
                            hover_data=['supplier_id'],
@@ -969,7 +1263,7 @@ def suppliers_tab(filtered_orders, suppliers, open_po):
                                   'avg_defect_rate': 'Average Defect Rate (%)',
                                   'otd_rate': 'On-Time Delivery %',
                                   'total_spend': 'Total Spend ($)'})
-    
+
     fig_matrix.add_annotation(text="BEST PERFORMANCE: Bottom-left (Low lead time + Low defects)",
                              xref="paper", yref="paper", x=0.02, y=0.98,
                              showarrow=False, font=dict(size=11, color="green"))
@@ -980,51 +1274,70 @@ def suppliers_tab(filtered_orders, suppliers, open_po):
         xaxis_title="Average Lead Time (days) → Lower is Better",
         yaxis_title="Average Defect Rate (%) → Lower is Better"
     )
+    return fig_matrix
+
+def suppliers_tab(order_summary, open_po):
+    """Show how well our suppliers are performing"""
+    st.markdown(f"### {display_icon('suppliers', 28)} Supplier Performance", unsafe_allow_html=True)
+    st.caption("Supplier scorecards, performance matrix, and relationship management")
+    
+    # Create a chart showing supplier performance
+    fig_matrix = build_supplier_matrix_chart(order_summary['supplier_perf'])
     st.plotly_chart(fig_matrix, use_container_width=True)
     
     # Rank suppliers by overall performance
     st.markdown("#### Supplier Scorecards")
     st.caption("Performance rankings based on delivery, quality, and lead time metrics")
     
-    # Combine performance data with supplier information
-    supplier_details = supplier_perf.merge(suppliers, on='supplier_id')
-    supplier_details['performance_score'] = (
-        (100 - supplier_details['avg_defect_rate']) * 0.3 +
-        supplier_details['otd_rate'] * 0.4 +
-        (100 - (supplier_details['avg_lead_time'] / supplier_details['avg_lead_time'].max() * 100)) * 0.3
-    )
-    
+    # Scores are ranked once per filter selection in get_order_summary
     # Show the best and worst performing suppliers
     col1, col2 = st.columns(2)
     
     with col1:
         st.markdown("##### Top Performers")
-        top_suppliers = supplier_details.nlargest(5, 'performance_score')[
-            ['supplier_id', 'supplier_name', 'performance_score', 'otd_rate', 'avg_defect_rate']
-        ]
-        st.dataframe(top_suppliers, use_container_width=True)
+        st.dataframe(order_summary['top_suppliers'], use_container_width=True)
     
     with col2:
         st.markdown("##### Needs Improvement")
-        bottom_suppliers = supplier_details.nsmallest(5, 'performance_score')[
-            ['supplier_id', 'supplier_name', 'performance_score', 'otd_rate', 'avg_defect_rate']
-        ]
-        st.dataframe(bottom_suppliers, use_container_width=True)
+        st.dataframe(order_summary['bottom_suppliers'], use_container_width=True)
+
+# Reason text for every combination of the four failure checks, joined the same way the
+# per-row version did it, so the table and CSV read exactly as before
+FAILURE_REASON_LABELS = np.array([
+    ', '.join([
+        'MRP Non-Compliant' if code & 8 else '',
+        'Setup Non-Compliant' if code & 4 else '',
+        'Late Delivery' if code & 2 else '',
+        'Quality Issues' if code & 1 else ''
+    ]).strip(', ')
+    for code in range(16)
+], dtype=object)
+
+@st.cache_resource(max_entries=32)
+def build_compliance_chart(compliance_by_category):
+    """Grouped bars of MRP and setup compliance per category"""
+    fig_compliance = px.bar(compliance_by_category, x='category', 
+                           y=['mrp_compliance', 'setup_compliance'],
+                           title="Process Compliance Rates by Product Category",
+                           barmode='group',
+                           color_discrete_sequence=['#0ea5e9', '#059669'],
+                           labels={'category': 'Product Category', 'value': 'Compliance Rate (%)', 'variable': 'Process Type'})
+    fig_compliance.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(size=12),
+        xaxis_title="Product Category",
+        yaxis_title="Compliance Rate (%) → Higher is Better",
+        legend_title="Process Type"
+    )
+    return fig_compliance
 
-def compliance_tab(filtered_orders):
+def compliance_tab(filtered_orders, compliance_summary):
     """Show how well we're following our processes"""
     st.markdown(f"### {display_icon('compliance', 28)} Process Compliance Analysis", unsafe_allow_html=True)
     st.caption("Happy path tracking, compliance rates, and process optimization")
     
-    # Find orders that went perfectly (no problems at all)
-    happy_path_orders = filtered_orders[
-        (filtered_orders['mrp_compliance'] == 'Compliant') & 
-        (filtered_orders['setup_compliance'] == 'Compliant') &
-        (filtered_orders['delivery_date'] <= filtered_orders['planned_delivery']) &
-        (filtered_orders['defect_rate'] < 1.0)
-    ]
-    
-    happy_path_rate = len(happy_path_orders) / len(filtered_orders) * 100 if len(filtered_orders) > 0 else 0
+    happy_path_rate = compliance_summary['happy_path_rate']
     
     col1, col2, col3, col4 = st.columns(4)
     
@@ -1038,7 +1351,7 @@ def compliance_tab(filtered_orders):
         """, unsafe_allow_html=True)
     
     with col2:
-        mrp_compliance = (filtered_orders['mrp_compliance'] == 'Compliant').mean() * 100
+        mrp_compliance = compliance_summary['mrp_compliance']
         st.markdown(f"""
         <div style="background: linear-gradient(135deg, #1e40af 0%, #3b82f6 100%); padding: 1.5rem; border-radius: 12px; color: white; margin: 0.5rem 0; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
             <div style="font-size: 0.875rem; opacity: 0.9; margin-bottom: 0.5rem;">MRP Compliance</div>
@@ -1048,7 +1361,7 @@ def compliance_tab(filtered_orders):
         """, unsafe_allow_html=True)
     
     with col3:
-        setup_compliance = (filtered_orders['setup_compliance'] == 'Compliant').mean() * 100
+        setup_compliance = compliance_summary['setup_compliance']
         st.markdown(f"""
         <div style="background: linear-gradient(135deg, #1e40af 0%, #3b82f6 100%); padding: 1.5rem; border-radius: 12px; color: white; margin: 0.5rem 0; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
             <div style="font-size: 0.875rem; opacity: 0.9; margin-bottom: 0.5rem;">Setup Compliance</div>
@@ -1058,8 +1371,7 @@ def compliance_tab(filtered_orders):
         """, unsafe_allow_html=True)
     
     with col4:
-        quality_orders = len(filtered_orders[filtered_orders['defect_rate'] < 1.0])
-        quality_rate = quality_orders / len(filtered_orders) * 100 if len(filtered_orders) > 0 else 0
+        quality_rate = compliance_summary['quality_rate']
         st.markdown(f"""
         <div style="background: linear-gradient(135deg, #1e40af 0%, #3b82f6 100%); padding: 1.5rem; border-radius: 12px; color: white; margin: 0.5rem 0; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
             <div style="font-size: 0.875rem; opacity: 0.9; margin-bottom: 0.5rem;">Quality Orders</div>
@@ -1072,25 +1384,25 @@ def compliance_tab(filtered_orders):
     st.markdown("#### Non-Compliant Orders Analysis")
     st.caption("Detailed breakdown of orders that failed to follow optimal processes")
     
-    failed_orders = filtered_orders[
-        (filtered_orders['mrp_compliance'] == 'Non-Compliant') | 
-        (filtered_orders['setup_compliance'] == 'Non-Compliant') |
-        (filtered_orders['delivery_date'] > filtered_orders['planned_delivery']) |
-        (filtered_orders['defect_rate'] >= 1.0)
-    ].copy()
+    # Compare the raw arrays so the mask is built without pandas indexer overhead
+    late = filtered_orders['delivery_date'].to_numpy() > filtered_orders['planned_delivery'].to_numpy()
+    quality_issue = filtered_orders['defect_rate'].to_numpy() >= 1.0
+    failed = filtered_orders['non_compliant'].to_numpy() | late | quality_issue
+    failed_orders = filtered_orders[failed]
     
     if len(failed_orders) > 0:
-        # Figure out what went wrong with each order
-        failed_orders['failure_reasons'] = failed_orders.apply(lambda row: 
-            ', '.join([
-                'MRP Non-Compliant' if row['mrp_compliance'] == 'Non-Compliant' else '',
-                'Setup Non-Compliant' if row['setup_compliance'] == 'Non-Compliant' else '',
-                'Late Delivery' if row['delivery_date'] > row['planned_delivery'] else '',
-                'Quality Issues' if row['defect_rate'] >= 1.0 else ''
-            ]).strip(', '), axis=1
+        # Figure out what went wrong with each order - the four checks form a 4-bit code
+        # that indexes a table of the 16 possible reason strings
+        reason_bits = (
+            (failed_orders['mrp_compliance'] == 'Non-Compliant').to_numpy().astype(np.int8) * 8 +
+            (failed_orders['setup_compliance'] == 'Non-Compliant').to_numpy().astype(np.int8) * 4 +
+            late[failed].astype(np.int8) * 2 +
+            quality_issue[failed].astype(np.int8)
+        )
+        # Take just the display columns and assign the reasons onto those - no full-width copy
+        failure_display = failed_orders[['order_id', 'supplier_id', 'category', 'total_value']].assign(
+            failure_reasons=FAILURE_REASON_LABELS[reason_bits]
         )
-        
-        failure_display = failed_orders[['order_id', 'supplier_id', 'category', 'total_value', 'failure_reasons']].copy()
         st.dataframe(failure_display, use_container_width=True)
         
         # Let users download the problem orders list
@@ -1105,40 +1417,39 @@ def compliance_tab(filtered_orders):
         st.success("STATUS: All orders are compliant!")
     
     # Show compliance rates by product category
-    compliance_by_category = filtered_orders.groupby('category').agg({
-        'mrp_compliance': lambda x: (x == 'Compliant').mean() * 100,
-        'setup_compliance': lambda x: (x == 'Compliant').mean() * 100
-    }).reset_index()
-    
-    fig_compliance = px.bar(compliance_by_category, x='category', 
-                           y=['mrp_compliance', 'setup_compliance'],
-                           title="Process Compliance Rates by Product Category",
-                           barmode='group',
-                           color_discrete_sequence=['#0ea5e9', '#059669'],
-                           labels={'category': 'Product Category', 'value': 'Compliance Rate (%)', 'variable': 'Process Type'})
-    fig_compliance.update_layout(
+    fig_compliance = build_compliance_chart(compliance_summary['compliance_by_category'])
+    st.plotly_chart(fig_compliance, use_container_width=True)
+
+@st.cache_resource(max_entries=32)
+def build_forecast_chart(forecast_data):
+    """Line chart of actual demand against the forecast"""
+    fig_forecast = go.Figure()
+    fig_forecast.add_trace(go.Scatter(x=forecast_data['date'], y=forecast_data['actual'],
+                                     mode='lines', name='Actual Demand', line=dict(color='#0ea5e9', width=3)))
+    fig_forecast.add_trace(go.Scatter(x=forecast_data['date'], y=forecast_data['forecast'],
+                                     mode='lines', name='Forecast', line=dict(color='#dc2626', dash='dash', width=3)))
+    fig_forecast.update_layout(
+        title="Actual Demand vs Forecast Accuracy Over Time", 
+        height=400,
         plot_bgcolor='rgba(0,0,0,0)',
         paper_bgcolor='rgba(0,0,0,0)',
         font=dict(size=12),
-        xaxis_title="Product Category",
-        yaxis_title="Compliance Rate (%) → Higher is Better",
-        legend_title="Process Type"
+        xaxis_title="Date",
+        yaxis_title="Demand Quantity (Units)",
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
     )
-    st.plotly_chart(fig_compliance, use_container_width=True)
+    return fig_forecast
 
-def forecast_tab(filtered_orders, products):
+def forecast_tab(forecast_summary, order_summary):
     """Show demand forecasting and what-if scenarios"""
     st.markdown(f"### {display_icon('forecast', 28)} Demand Forecasting & Scenarios", unsafe_allow_html=True)
     st.caption("Forecast accuracy analysis and scenario planning simulation")
     
-    # Create sample forecast vs actual demand data
-    forecast_data = generate_forecast_data(filtered_orders)
-    
     # Show how accurate our forecasts are
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        mape = calculate_mape(forecast_data['actual'], forecast_data['forecast'])
+        mape = forecast_summary['mape']
         st.markdown(f"""
         <div style="background: linear-gradient(135deg, #1e40af 0%, #3b82f6 100%); padding: 1.5rem; border-radius: 12px; color: white; margin: 0.5rem 0; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
             <div style="font-size: 0.875rem; opacity: 0.9; margin-bottom: 0.5rem;">Forecast Accuracy (MAPE)</div>
@@ -1158,7 +1469,7 @@ def forecast_tab(filtered_orders, products):
         """, unsafe_allow_html=True)
     
     with col3:
-        bias = (forecast_data['forecast'] - forecast_data['actual']).mean()
+        bias = forecast_summary['bias']
         st.markdown(f"""
         <div style="background: linear-gradient(135deg, #1e40af 0%, #3b82f6 100%); padding: 1.5rem; border-radius: 12px; color: white; margin: 0.5rem 0; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
             <div style="font-size: 0.875rem; opacity: 0.9; margin-bottom: 0.5rem;">Forecast Bias</div>
@@ -1168,23 +1479,14 @@ def forecast_tab(filtered_orders, products):
         """, unsafe_allow_html=True)
     
     # Chart showing predicted vs actual demand over time
-    fig_forecast = go.Figure()
-    fig_forecast.add_trace(go.Scatter(x=forecast_data['date'], y=forecast_data['actual'],
-                                     mode='lines', name='Actual Demand', line=dict(color='#0ea5e9', width=3)))
-    fig_forecast.add_trace(go.Scatter(x=forecast_data['date'], y=forecast_data['forecast'],
-                                     mode='lines', name='Forecast', line=dict(color='#dc2626', dash='dash', width=3)))
-    fig_forecast.update_layout(
-        title="Actual Demand vs Forecast Accuracy Over Time", 
-        height=400,
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(size=12),
-        xaxis_title="Date",
-        yaxis_title="Demand Quantity (Units)",
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-    )
+    fig_forecast = build_forecast_chart(forecast_summary['forecast_data'])
     st.plotly_chart(fig_forecast, use_container_width=True)
     
+    scenario_section(order_summary['kpis'])
+
+@st.fragment
+def scenario_section(kpis):
+    """Scenario sliders and results, rerun on their own so slider moves don't redraw the whole page"""
     # Let users test what happens if things change
     st.markdown("#### Scenario Simulation")
     st.caption("Test the impact of changes in lead times and demand on key performance metrics")
@@ -1200,7 +1502,7 @@ def forecast_tab(filtered_orders, products):
     # Run scenario button with spacing
     st.markdown("")
     if st.button("Run Scenario", type="primary"):
-        scenario_results = run_scenario_simulation(filtered_orders, lead_time_change, demand_change)
+        scenario_results = run_scenario_simulation(kpis, lead_time_change, demand_change)
         
         # Clean spacing before results
         st.markdown("---")
@@ -1241,21 +1543,36 @@ def generate_forecast_data(orders):
     """Create sample data comparing forecasts to what actually happened"""
     np.random.seed(42)
     
-    # Add up all orders for each day
-    daily_demand = orders.groupby(orders['order_date'].dt.date)['quantity'].sum().reset_index()
-    daily_demand.columns = ['date', 'actual']
+    # Add up all orders for each day with bincount over the day numbers, keeping only
+    # days that had orders and turning those back into dates just for the chart
+    day = orders['order_day'].to_numpy()
+    quantity = orders['quantity'].to_numpy()
+    if day.dtype.kind == 'f':
+        # Missing order dates make the day column float - leave those orders out
+        has_day = ~np.isnan(day)
+        day, quantity = day[has_day].astype(np.int64), quantity[has_day]
+    if len(day) == 0:
+        return pd.DataFrame({'date': [], 'actual': [], 'forecast': []})
+    
+    first_day = day.min()
+    offsets = day - first_day
+    order_days = np.flatnonzero(np.bincount(offsets))
+    demand = np.bincount(offsets, weights=quantity)[order_days]
+    daily_demand = pd.DataFrame({
+        'date': np.datetime_as_string((first_day + order_days).astype('datetime64[D]'), unit='D'),
+        'actual': demand.astype(np.int64)
+    })
     
     # Create forecasts that are close but not perfect
     daily_demand['forecast'] = daily_demand['actual'] * np.random.uniform(0.85, 1.15, len(daily_demand))
     
     return daily_demand
 
-def run_scenario_simulation(orders, lead_time_change, demand_change):
+def run_scenario_simulation(kpis, lead_time_change, demand_change):
     """Calculate what happens if lead times or demand changes"""
-    # Calculate current baseline metrics
-    base_otd = calculate_otd_percentage(orders)
-    base_inventory = orders['total_value'].sum() * 0.3  # Assume 30% inventory ratio
-    base_cost = orders['quality_cost'].sum() + orders['late_penalty'].sum()
+    # Baseline metrics come from the order KPIs already reduced for this filter selection
+    base_inventory = kpis['total_spend'] * 0.3  # Assume 30% inventory ratio
+    base_cost = kpis['copq']
     
     # Estimate how changes would affect performance
     otd_impact = -lead_time_change * 0.5  # Lead time increase reduces OTD
@@ -1335,11 +1652,20 @@ def main():
     with col1:
         with st.container():
             st.markdown("### Dashboard Controls")
-            filters = create_dashboard_controls(orders, suppliers, products)
+            filters = create_dashboard_controls(get_filter_options())
     
     with col2:
         with st.container():
-            filtered_orders = filter_data(orders, products, filters)
+            # Sorted tuples give the filter caches a stable, hashable key
+            filter_key = (
+                tuple(filters['date_range']),
+                tuple(sorted(filters['suppliers'])),
+                tuple(sorted(filters['categories'])),
+                tuple(sorted(filters['abc_classes'])),
+                filters['compliance']
+            )
+            filtered_orders = get_filtered_orders(*filter_key)
+            order_summary = get_order_summary(*filter_key)
     
         # Tell the user what data we're showing
         if len(filtered_orders) == 0:
@@ -1347,13 +1673,15 @@ def main():
             filtered_orders = orders
         else:
             # Show current data stats with timestamp
-            unique_suppliers = len(filtered_orders['supplier_id'].unique())
+            unique_suppliers = order_summary['unique_suppliers']
             try:
                 latest_update = filtered_orders['created_timestamp'].max() if 'created_timestamp' in filtered_orders.columns else filtered_orders['order_date'].max()
                 st.success(f"Analyzing {len(filtered_orders):,} orders from {unique_suppliers} suppliers (Last update: {latest_update.strftime('%H:%M:%S')})")
             except:
                 st.success(f"Analyzing {len(filtered_orders):,} orders from {unique_suppliers} suppliers")
         
+        inventory_summary = get_inventory_summary()
+        
         # Create the main tabs for different sections with custom styling
         st.markdown("""
         <style>
@@ -1417,19 +1745,19 @@ def main():
         ])
         
         with tab1:
-            overview_tab(filtered_orders, inventory, products, suppliers)
+            overview_tab(order_summary, inventory_summary)
         
         with tab2:
-            inventory_tab(inventory, products, open_po)
+            inventory_tab(open_po, inventory_summary)
         
         with tab3:
-            suppliers_tab(filtered_orders, suppliers, open_po)
+            suppliers_tab(order_summary, open_po)
         
         with tab4:
-            compliance_tab(filtered_orders)
+            compliance_tab(filtered_orders, get_compliance_summary(*filter_key))
         
         with tab5:
-            forecast_tab(filtered_orders, products)
+            forecast_tab(get_forecast_summary(*filter_key), order_summary)
             
 
     
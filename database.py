@@ -148,8 +148,8 @@ def load_data_to_db(orders_df, inventory_df, suppliers_df, products_df):
         print(f"Data loading failed: {e}")
         return False
 
-def load_data_from_db():
-    """Load data from PostgreSQL for the app"""
+def load_data_from_db(csv_fallback=True):
+    """Load data from PostgreSQL for the app, or from the CSVs if the database fails and csv_fallback is set"""
     try:
         # Create SQLAlchemy engine
         db_url = f"postgresql://{st.secrets.get('DB_USER', '')}:{st.secrets.get('DB_PASSWORD', '')}@{st.secrets.get('DB_HOST', '')}:{st.secrets.get('DB_PORT', '5432')}/{st.secrets.get('DB_NAME', '')}"
@@ -168,7 +168,9 @@ def load_data_from_db():
         return orders, inventory, products, suppliers
     except Exception as e:
         print(f"Database load failed: {e}")
-        return load_csv_fallback()
+        if csv_fallback:
+            return load_csv_fallback()
+        return None, None, None, None
 
 def load_csv_fallback():
     """Fallback to CSV files if database fails"""
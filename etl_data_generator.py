@@ -162,56 +162,47 @@ def generate_incremental_data():
     
     orders_df = pd.DataFrame(orders_data)
     
-    # Generate inventory with dynamic stock levels
-    inventory_data = []
-    for _, product in products_df.iterrows():
-        # Realistic stock levels based on ABC class and category
-        if product['abc_class'] == 'A':
-            current_stock = np.random.randint(30, 300)  # Lower stock for expensive items
-            safety_stock = np.random.randint(10, 50)
-        elif product['abc_class'] == 'B':
-            current_stock = np.random.randint(80, 600)
-            safety_stock = np.random.randint(25, 120)
-        else:
-            current_stock = np.random.randint(150, 1200)
-            safety_stock = np.random.randint(50, 250)
-        
-        # Realistic EOQ based on demand and cost
-        annual_demand = np.random.randint(500, 5000)
-        ordering_cost = 50  # Fixed ordering cost
-        carrying_cost_rate = 0.20  # 20% carrying cost
-        eoq = int(np.sqrt(2 * annual_demand * ordering_cost / (product['unit_cost'] * carrying_cost_rate)))
-        eoq = max(10, min(eoq, 1000))  # Realistic bounds
-        
-        # Reorder point based on lead time demand
-        avg_daily_demand = annual_demand / 365
-        avg_lead_time = 10  # Average lead time
-        rop = int(avg_daily_demand * avg_lead_time) + safety_stock
-        
-        # Stock status
-        if current_stock < safety_stock:
-            stock_status = 'Critical'
-        elif current_stock < rop:
-            stock_status = 'Low'
-        else:
-            stock_status = 'Normal'
-        
-        inventory_value = current_stock * product['unit_cost']
-        carrying_cost = inventory_value * carrying_cost_rate
-        
-        inventory_data.append({
-            'product_id': product['product_id'],
-            'current_stock': current_stock,
-            'safety_stock': safety_stock,
-            'eoq': eoq,
-            'rop': rop,
-            'inventory_value': round(inventory_value, 2),
-            'carrying_cost': round(carrying_cost, 2),
-            'stock_status': stock_status,
-            'updated_timestamp': datetime.now()
-        })
+    # Generate inventory with dynamic stock levels, one vectorized draw per column
+    n_products = len(products_df)
+    unit_cost = products_df['unit_cost'].to_numpy()
+    abc_class = products_df['abc_class'].to_numpy()
+    is_a, is_b = abc_class == 'A', abc_class == 'B'
+    
+    # Realistic stock levels based on ABC class - lower stock for expensive A items
+    current_stock = np.random.randint(np.select([is_a, is_b], [30, 80], 150),
+                                      np.select([is_a, is_b], [300, 600], 1200))
+    safety_stock = np.random.randint(np.select([is_a, is_b], [10, 25], 50),
+                                     np.select([is_a, is_b], [50, 120], 250))
+    
+    # Realistic EOQ based on demand and cost
+    annual_demand = np.random.randint(500, 5000, n_products)
+    ordering_cost = 50  # Fixed ordering cost
+    carrying_cost_rate = 0.20  # 20% carrying cost
+    eoq = np.sqrt(2 * annual_demand * ordering_cost / (unit_cost * carrying_cost_rate)).astype(int)
+    eoq = np.clip(eoq, 10, 1000)  # Realistic bounds
+    
+    # Reorder point based on lead time demand
+    avg_daily_demand = annual_demand / 365
+    avg_lead_time = 10  # Average lead time
+    rop = (avg_daily_demand * avg_lead_time).astype(int) + safety_stock
+    
+    # Stock status
+    stock_status = np.select([current_stock < safety_stock, current_stock < rop], ['Critical', 'Low'], 'Normal')
+    
+    inventory_value = current_stock * unit_cost
+    carrying_cost = inventory_value * carrying_cost_rate
     
-    inventory_df = pd.DataFrame(inventory_data)
+    inventory_df = pd.DataFrame({
+        'product_id': products_df['product_id'].to_numpy(),
+        'current_stock': current_stock,
+        'safety_stock': safety_stock,
+        'eoq': eoq,
+        'rop': rop,
+        'inventory_value': np.round(inventory_value, 2),
+        'carrying_cost': np.round(carrying_cost, 2),
+        'stock_status': stock_status,
+        'updated_timestamp': datetime.now()
+    })
     
     return orders_df, inventory_df, suppliers_df, products_df
 
@@ -1,6 +1,13 @@
 import pandas as pd
 import numpy as np
 
+# Numba is optional; without it the KPI helpers fall back to pandas reductions
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 def calculate_eoq(annual_demand, ordering_cost, holding_cost):
     """Find the best order quantity to minimize total costs"""
     return np.sqrt((2 * annual_demand * ordering_cost) / holding_cost)
@@ -21,12 +28,40 @@ def calculate_inventory_turnover(cogs, avg_inventory):
 
 def calculate_otd_percentage(df, date_col='delivery_date', planned_col='planned_delivery'):
     """Calculate what percentage of orders arrived on time"""
-    on_time = df[date_col] <= df[planned_col]
-    return (on_time.sum() / len(df)) * 100
+    # Compare the raw datetime64 arrays - numpy reconciles units and treats NaT as not on time
+    delivered = df[date_col].to_numpy()
+    planned = df[planned_col].to_numpy()
+    return np.count_nonzero(delivered <= planned) / len(df) * 100
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _mape_kernel(actual, forecast):
+        """Sum the absolute percentage errors in one pass, skipping days with no actual demand"""
+        error_sum = 0.0
+        count = 0
+        for i in range(len(actual)):
+            if actual[i] != 0:
+                error_sum += abs((actual[i] - forecast[i]) / actual[i])
+                count += 1
+        return error_sum / count * 100 if count else np.nan
 
 def calculate_mape(actual, forecast):
     """Measure how far off our forecasts were from reality"""
-    return np.mean(np.abs((actual - forecast) / actual)) * 100
+    actual = np.ascontiguousarray(actual, dtype=np.float64)
+    forecast = np.ascontiguousarray(forecast, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        return _mape_kernel(actual, forecast)
+    
+    # Zero actuals would divide by zero, so leave them out like the kernel does - one
+    # error buffer is divided and abs'd in place and the sum skips the masked days
+    nonzero = actual != 0
+    count = np.count_nonzero(nonzero)
+    if not count:
+        return np.nan
+    errors = np.subtract(actual, forecast)
+    np.divide(errors, actual, out=errors, where=nonzero)
+    np.abs(errors, out=errors)
+    return errors.sum(where=nonzero) / count * 100
 
 def calculate_forecast_accuracy(actual, forecast):
     """Calculate how accurate our forecasts were as a percentage"""
@@ -52,12 +87,93 @@ def identify_abc_classification(df, value_col, qty_col):
 
 def calculate_process_compliance(df, process_steps):
     """Calculate what percentage of orders followed proper processes"""
-    compliance_scores = []
-    for step in process_steps:
-        if step in df.columns:
-            compliance = (df[step] == 'Compliant').sum() / len(df) * 100
-            compliance_scores.append(compliance)
-    return np.mean(compliance_scores) if compliance_scores else 0
+    steps = [step for step in process_steps if step in df.columns]
+    if not steps:
+        return 0
+    # Every step has the same number of orders, so the mean of the per-step rates
+    # is just the mean over the whole comparison block
+    return (df[steps] == 'Compliant').to_numpy().mean() * 100
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _order_kpi_kernel(quality_cost, late_penalty, total_value, lead_time, defect_rate,
+                          on_time, mrp_ok, setup_ok):
+        """Sum every order KPI column in a single pass, skipping missing values like pandas does"""
+        quality_sum = 0.0
+        penalty_sum = 0.0
+        value_sum = 0.0
+        lead_sum = 0.0
+        lead_count = 0
+        defect_sum = 0.0
+        defect_count = 0
+        on_time_count = 0
+        compliant_count = 0
+        n = len(total_value)
+        for i in range(n):
+            if not np.isnan(quality_cost[i]):
+                quality_sum += quality_cost[i]
+            if not np.isnan(late_penalty[i]):
+                penalty_sum += late_penalty[i]
+            if not np.isnan(total_value[i]):
+                value_sum += total_value[i]
+            if not np.isnan(lead_time[i]):
+                lead_sum += lead_time[i]
+                lead_count += 1
+            if not np.isnan(defect_rate[i]):
+                defect_sum += defect_rate[i]
+                defect_count += 1
+            on_time_count += on_time[i]
+            compliant_count += mrp_ok[i] + setup_ok[i]
+        return (quality_sum, penalty_sum, value_sum, lead_sum, lead_count,
+                defect_sum, defect_count, on_time_count, compliant_count, n)
+
+def calculate_order_kpis(df):
+    """Work out the headline order KPIs (costs, spend, OTD, lead time, compliance, defects)"""
+    if NUMBA_AVAILABLE and len(df) > 0:
+        (quality_sum, penalty_sum, value_sum, lead_sum, lead_count,
+         defect_sum, defect_count, on_time_count, compliant_count, n) = _order_kpi_kernel(
+            df['quality_cost'].to_numpy(dtype=np.float64),
+            df['late_penalty'].to_numpy(dtype=np.float64),
+            df['total_value'].to_numpy(dtype=np.float64),
+            df['lead_time'].to_numpy(dtype=np.float64),
+            df['defect_rate'].to_numpy(dtype=np.float64),
+            df['on_time'].to_numpy(dtype=np.bool_),
+            df['mrp_ok'].to_numpy(dtype=np.bool_),
+            df['setup_ok'].to_numpy(dtype=np.bool_)
+        )
+        return {
+            'copq': quality_sum + penalty_sum,
+            'total_spend': value_sum,
+            'otd_pct': on_time_count / n * 100,
+            'avg_lead_time': lead_sum / lead_count if lead_count else np.nan,
+            'compliance': compliant_count / (2 * n) * 100,
+            'avg_defect_rate': defect_sum / defect_count if defect_count else np.nan
+        }
+    
+    # Pull each column out once and reduce the raw arrays, skipping NaN like pandas does
+    quality_cost = df['quality_cost'].to_numpy(dtype=np.float64)
+    late_penalty = df['late_penalty'].to_numpy(dtype=np.float64)
+    total_value = df['total_value'].to_numpy(dtype=np.float64)
+    lead_time = df['lead_time'].to_numpy(dtype=np.float64)
+    defect_rate = df['defect_rate'].to_numpy(dtype=np.float64)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return {
+            'copq': np.nansum(quality_cost) + np.nansum(late_penalty),
+            'total_spend': np.nansum(total_value),
+            'otd_pct': np.count_nonzero(df['on_time'].to_numpy()) / len(df) * 100,
+            'avg_lead_time': np.nansum(lead_time) / np.count_nonzero(~np.isnan(lead_time)),
+            'compliance': df[['mrp_ok', 'setup_ok']].to_numpy().mean() * 100,
+            'avg_defect_rate': np.nansum(defect_rate) / np.count_nonzero(~np.isnan(defect_rate))
+        }
+
+def calculate_supplier_kpis(df):
+    """Average defect rate, lead time, total spend and on-time share for each supplier"""
+    return df.groupby('supplier_id', observed=True, sort=False).agg(
+        avg_defect_rate=('defect_rate', 'mean'),
+        avg_lead_time=('lead_time', 'mean'),
+        total_spend=('total_value', 'sum'),
+        otd_rate=('on_time', 'mean')
+    ).reset_index()
 
 def generate_kpi_summary(df):
     """Create a summary of all the key performance indicators"""